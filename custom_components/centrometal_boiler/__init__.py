@@ -1,18 +1,38 @@
 """Support for Centrometal Boiler devices."""
 
+import asyncio
 import logging
-import datetime
+import random
+import ssl
 import time
-from typing import Optional, Callable
+from typing import Awaitable, Callable, Optional
 
+import aiohttp
 from centrometal_web_boiler import WebBoilerClient
 
+# One SSL context shared by every websocket (re)connect of every account;
+# loading the CA bundle is slow blocking I/O, so do it once, off the loop.
+_SSL_CTX_LOCK = asyncio.Lock()
+_SSL_CTX: Optional[ssl.SSLContext] = None
+
+
+async def _async_get_ssl_context(hass=None) -> ssl.SSLContext:
+    """Return the shared SSL context, creating it in an executor on first use."""
+    global _SSL_CTX
+    async with _SSL_CTX_LOCK:
+        if _SSL_CTX is None:
+            if hass is not None:
+                _SSL_CTX = await hass.async_add_executor_job(ssl.create_default_context)
+            else:
+                loop = asyncio.get_running_loop()
+                _SSL_CTX = await loop.run_in_executor(None, ssl.create_default_context)
+    return _SSL_CTX
+
+
 # ---------------------------------------------------------------------
 # Monkey patch: avoid blocking SSL certificate loading in the event loop.
 # ---------------------------------------------------------------------
 try:
-    import asyncio
-    import ssl
     from centrometal_web_boiler.WebBoilerWsClient import WebBoilerWsClient  # type: ignore
     from centrometal_web_boiler.const import WEB_BOILER_STOMP_URL  # type: ignore
 
@@ -21,8 +41,8 @@ try:
         self.username = username
         self.logger.info(f"WebBoilerWsClient connecting... ({self.username})")
 
-        loop = asyncio.get_running_loop()
-        ssl_ctx = await loop.run_in_executor(None, ssl.create_default_context)
+        # Normally already prepared by async_setup_entry, so no executor hop here.
+        ssl_ctx = _SSL_CTX or await _async_get_ssl_context()
 
         # Kick off the internal websocket connection task using the prebuilt SSL context.
         self.client.loop.create_task(
@@ -32,7 +52,7 @@ try:
     if not getattr(WebBoilerWsClient.start, "_patched_by_centrometal_boiler", False):
         WebBoilerWsClient.start = _patched_ws_start  # type: ignore[assignment]
         WebBoilerWsClient.start._patched_by_centrometal_boiler = True
-except Exception:
+except (ImportError, AttributeError):
     # If something changes upstream and this import/patch fails, skip it safely.
     pass
 
@@ -60,7 +80,7 @@ try:
     if not getattr(WebBoilerDevice.get_parameter, "_patched_by_centrometal_boiler", False):
         WebBoilerDevice.get_parameter = _patched_get_parameter  # type: ignore[assignment]
         WebBoilerDevice.get_parameter._patched_by_centrometal_boiler = True
-except Exception:
+except (ImportError, AttributeError):
     # Safe to ignore if the import/module name is different in this version.
     pass
 
@@ -74,18 +94,24 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_STOP,
 )
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.event import async_track_time_interval
 
+from .common import EntryState
 from .const import (
     DOMAIN,
-    WEB_BOILER_CLIENT,
-    WEB_BOILER_SYSTEM,
     WEB_BOILER_LOGIN_RETRY_INTERVAL,
+    WEB_BOILER_LOGIN_RETRY_MAX_INTERVAL,
+    WEB_BOILER_NO_DATA_INTERVAL,
     WEB_BOILER_REFRESH_INTERVAL,
+    WEB_BOILER_RELOAD_COOLDOWN,
+    WEB_BOILER_STALE_INTERVAL,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# hass.data key of {entry_id: monotonic time of the last watchdog reload}.
+# Kept outside the per-entry state, which a reload throws away.
+_WATCHDOG_RELOADS = f"{DOMAIN}_watchdog_reloads"
+
 PLATFORMS = ["sensor", "switch", "binary_sensor"]
 
 
@@ -104,15 +130,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     web_boiler_system = WebBoilerSystem(
         hass=hass,
+        entry_id=entry.entry_id,
         username=entry.data[CONF_EMAIL],
         password=entry.data[CONF_PASSWORD],
         prefix=prefix,
     )
 
     unique_id = entry.data[CONF_EMAIL]
-    hass.data[DOMAIN][unique_id] = {}
-    hass.data[DOMAIN][unique_id][WEB_BOILER_SYSTEM] = web_boiler_system
-    hass.data[DOMAIN][unique_id][WEB_BOILER_CLIENT] = web_boiler_system.web_boiler_client
+    hass.data[DOMAIN][unique_id] = EntryState(
+        system=web_boiler_system,
+        client=web_boiler_system.web_boiler_client,
+    )
+
+    # Prepare the websocket SSL context on HA's executor before connecting.
+    await _async_get_ssl_context(hass)
 
     # Login, get configuration, open websocket, initial refresh
     ok = await web_boiler_system.start()
@@ -128,8 +159,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         web_boiler_system.stop,  # accepts optional event
     )
 
-    # Start periodic maintenance loop (tick) - drives refresh/reconnect.
-    web_boiler_system.start_tick()
+    # Start periodic maintenance loop (tick) - drives refresh/reconnect/reload.
+    web_boiler_system.start_tick(entry)
 
     # Load sensor / switch / binary_sensor platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -144,29 +175,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a Centrometal account cleanly (called on reload/remove)."""
     unique_id = entry.data[CONF_EMAIL]
-    store = hass.data.get(DOMAIN, {}).get(unique_id)
-    system: Optional["WebBoilerSystem"] = None
-    if store:
-        system = store.get(WEB_BOILER_SYSTEM)
+    state: Optional[EntryState] = hass.data.get(DOMAIN, {}).get(unique_id)
+    system: Optional["WebBoilerSystem"] = state.system if state else None
 
     # Stop tick + websocket before unloading platforms to avoid callbacks into removed entities
     if system:
-        try:
-            system.cancel_tick()
-        except Exception:
-            pass
+        system.cancel_tick()
         try:
             await system.stop()
-        except Exception:
-            pass
+        except (ConnectionError, aiohttp.ClientError, asyncio.TimeoutError) as ex:
+            _LOGGER.debug("Centrometal stop on unload failed: %s", ex)
 
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     # Cleanup hass.data
-    try:
-        hass.data[DOMAIN].pop(unique_id, None)
-    except Exception:
-        pass
+    hass.data.get(DOMAIN, {}).pop(unique_id, None)
 
     return unload_ok
 
@@ -178,11 +201,13 @@ class WebBoilerSystem:
         self,
         hass: HomeAssistant,
         *,
+        entry_id: str,
         username: str,
         password: str,
         prefix: str,
     ) -> None:
         self._hass = hass
+        self._entry_id = entry_id
         self.username = username
         self.password = password
 
@@ -191,14 +216,52 @@ class WebBoilerSystem:
 
         self.web_boiler_client = WebBoilerClient()
 
-        now_ts = datetime.datetime.now().timestamp()
-        self.last_relogin_timestamp = now_ts
-        self.last_refresh_timestamp = now_ts
+        # The client has a single connectivity callback slot; own it here,
+        # keep the latest status as a plain flag and fan it out to listeners.
+        self.websocket_connected = False
+        self._connectivity_listeners: list[Callable[[bool], Awaitable[None]]] = []
+        self.web_boiler_client.set_connectivity_callback(
+            self._on_connectivity_changed
+        )
 
-        self._tick_unsub: Optional[Callable[[], None]] = None
+        # Consecutive failed relogin/refresh attempts; drives the retry backoff.
+        self._backoff_attempt = 0
+        self._tick_task: Optional[asyncio.Task] = None
+        # Set on websocket disconnect to cut the tick loop's sleep short.
+        self._tick_wake = asyncio.Event()
+
+        # Watchdog state; the reload cooldown lives in hass.data (see
+        # _schedule_reload) so it carries over the reloads it triggers.
+        self.watchdog_started_ts = time.monotonic()
+        # Monotonic time of the latest websocket parameter push.
+        self.last_param_update_ts: Optional[float] = None
+
+    async def _on_connectivity_changed(self, connected: bool) -> None:
+        """Called by the library when the websocket connects or disconnects."""
+        was_connected = self.websocket_connected
+        self.websocket_connected = bool(connected)
+        # Only a connected -> disconnected change wakes the loop. The library
+        # also reports False on close; waking on those too would turn a
+        # socket that keeps dropping into back-to-back relogins.
+        if was_connected and not connected:
+            self._tick_wake.set()
+        for listener in list(self._connectivity_listeners):
+            await listener(connected)
+
+    def add_connectivity_listener(
+        self, listener: Callable[[bool], Awaitable[None]]
+    ) -> Callable[[], None]:
+        """Register a coroutine called on connectivity changes; returns an unsubscribe."""
+        self._connectivity_listeners.append(listener)
+        return lambda: self._connectivity_listeners.remove(listener)
 
     async def on_parameter_updated(self, device, param, create: bool = False):
         """Called by the library when a parameter changes via websocket push."""
+        if not create:
+            # create=True is the library re-announcing every known parameter
+            # on (dis)connect, which says nothing about the data being fresh.
+            self.last_param_update_ts = time.monotonic()
+
         action = "Create" if create else "update"
         serial = device["serial"]
         name = param["name"]
@@ -244,7 +307,6 @@ class WebBoilerSystem:
 
             # Pull initial "working table" data after websocket start.
             await self.web_boiler_client.refresh()
-            self.last_refresh_timestamp = time.time()
 
             return True
 
@@ -252,28 +314,63 @@ class WebBoilerSystem:
             _LOGGER.error("Authentication failed : %s", str(ex))
             return False
 
-    def start_tick(self) -> None:
-        """Start the periodic maintenance loop; safe to call multiple times."""
+    def start_tick(self, entry: ConfigEntry) -> None:
+        """Start the periodic maintenance loop; safe to call multiple times.
+
+        Runs as a background task of the entry, so HA cancels it on unload
+        and on shutdown.
+        """
         # Cancel previous if exists
         self.cancel_tick()
-
-        async def _on_interval(_now) -> None:
-            try:
-                await self.tick()
-            except Exception as ex:
-                _LOGGER.warning("WebBoilerSystem.tick raised: %s", ex)
-
-        # Run tick every second (lightweight logic; intervals control actual actions)
-        self._tick_unsub = async_track_time_interval(self._hass, _on_interval, datetime.timedelta(seconds=1))
+        self._tick_task = entry.async_create_background_task(
+            self._hass, self._tick_loop(), f"{DOMAIN} tick {self.username}"
+        )
 
     def cancel_tick(self) -> None:
         """Cancel the periodic maintenance loop if running."""
-        if self._tick_unsub:
+        if self._tick_task:
+            self._tick_task.cancel()
+            self._tick_task = None
+
+    def _next_tick_delay(self) -> float:
+        """Return seconds to sleep before the next tick.
+
+        Connected: wait for the regular refresh interval.
+        Disconnected: exponential backoff with jitter, so many accounts do not
+        hammer the server in lockstep after it restarts.
+        """
+        if self.web_boiler_client.is_websocket_connected():
+            return WEB_BOILER_REFRESH_INTERVAL
+        delay = min(
+            WEB_BOILER_LOGIN_RETRY_MAX_INTERVAL,
+            WEB_BOILER_LOGIN_RETRY_INTERVAL * 2**self._backoff_attempt,
+        )
+        return delay + random.uniform(0, delay * 0.2)
+
+    async def _tick_loop(self) -> None:
+        """Sleep until the next action is due, then run tick(); forever.
+
+        A websocket disconnect ends the sleep early, so the relogin starts
+        right away instead of after the refresh interval.
+        """
+        while True:
+            # Cleared before the delay is picked: a disconnect that happened
+            # meanwhile is already reflected in the backoff delay.
+            self._tick_wake.clear()
             try:
-                self._tick_unsub()
-            except Exception:
+                await asyncio.wait_for(
+                    self._tick_wake.wait(), self._next_tick_delay()
+                )
+            except asyncio.TimeoutError:
                 pass
-            self._tick_unsub = None
+            try:
+                await self.tick()
+            except asyncio.CancelledError:
+                raise
+            except Exception as ex:  # pylint: disable=broad-except
+                # Last line of defence: whatever happens, keep the loop alive.
+                self._backoff_attempt += 1
+                _LOGGER.warning("WebBoilerSystem.tick raised: %s", ex)
 
     async def stop(self, event=None):
         """Close the websocket when Home Assistant shuts down or unloads."""
@@ -281,66 +378,105 @@ class WebBoilerSystem:
             "Stopping Centrometal WebBoilerSystem %s",
             self.web_boiler_client.username,
         )
+        # Stop ticking first: closing the websocket reports a disconnect,
+        # which would otherwise wake the loop into a relogin.
+        self.cancel_tick()
         # Close WS; HTTP session closed by library on relogin/teardown as needed
         return await self.web_boiler_client.close_websocket()
 
     async def tick(self):
-        """Periodic check.
+        """Periodic maintenance step; decides noop/refresh/relogin/reload.
 
-        - If websocket disconnected and long enough passed -> relogin().
-        - If websocket connected and refresh interval passed -> refresh().
+        - If websocket disconnected -> relogin().
+        - If connected but no data change in too long -> reload the entry.
+        - Otherwise -> refresh(), relogin() if that fails.
         """
-        now = datetime.datetime.now().timestamp()
-
-        # If we're offline, try to relogin occasionally
-        try:
-            connected = self.web_boiler_client.is_websocket_connected()
-        except Exception:
-            connected = False
+        connected = self.web_boiler_client.is_websocket_connected()
 
         if not connected:
-            if now - self.last_relogin_timestamp > WEB_BOILER_LOGIN_RETRY_INTERVAL:
-                _LOGGER.info(
-                    "Centrometal WebBoilerSystem::tick trying to relogin %s",
-                    self.web_boiler_client.username,
-                )
-                await self.relogin()
-            return
-
-        # If we're online and it's time to refresh, do it
-        if now - self.last_refresh_timestamp > WEB_BOILER_REFRESH_INTERVAL:
-            self.last_refresh_timestamp = now
             _LOGGER.info(
-                "WebBoilerSystem::tick refresh data %s",
+                "Centrometal WebBoilerSystem::tick trying to relogin %s",
                 self.web_boiler_client.username,
             )
-            refresh_successful = await self.web_boiler_client.refresh()
-            if not refresh_successful:
-                await self.relogin()
+            await self.relogin()
+            return
 
-    async def relogin(self):
-        """Try to restore the websocket session after disconnect or bad refresh."""
-        self.last_relogin_timestamp = time.time()
+        reload_reason = self._stale_reason()
+        if reload_reason is not None and self._schedule_reload(reload_reason):
+            return
 
-        try:
-            await self.web_boiler_client.close_websocket()
-        except Exception:
-            pass
+        _LOGGER.info(
+            "WebBoilerSystem::tick refresh data %s",
+            self.web_boiler_client.username,
+        )
+        refresh_successful = await self.web_boiler_client.refresh()
+        if refresh_successful:
+            self._backoff_attempt = 0
+        else:
+            await self.relogin()
+
+    def _stale_reason(self) -> str | None:
+        """Return why the data looks stale, or None if it looks fresh."""
+        now_ts = time.monotonic()
+        latest_ts = self.last_param_update_ts
+        if latest_ts is None:
+            # Never saw any push since start: treat as stale after a while
+            if now_ts - self.watchdog_started_ts > WEB_BOILER_NO_DATA_INTERVAL:
+                return "no parameter updates received"
+            return None
+        if (now_ts - latest_ts) > WEB_BOILER_STALE_INTERVAL:
+            return f"stale data ({int(now_ts - latest_ts)}s > {WEB_BOILER_STALE_INTERVAL}s)"
+        return None
+
+    def _schedule_reload(self, reason: str) -> bool:
+        """Schedule a config entry reload unless the watchdog did one recently.
+
+        The first watchdog reload of an entry is never held back.
+        """
+        now_ts = time.monotonic()
+        reloads: dict[str, float] = self._hass.data.setdefault(_WATCHDOG_RELOADS, {})
+        last_reload_ts = reloads.get(self._entry_id)
+        if last_reload_ts is not None:
+            since_reload = now_ts - last_reload_ts
+            if since_reload < WEB_BOILER_RELOAD_COOLDOWN:
+                _LOGGER.warning(
+                    "Centrometal watchdog: would reload (%s) but in cooldown (%ss remaining)",
+                    reason,
+                    int(WEB_BOILER_RELOAD_COOLDOWN - since_reload),
+                )
+                return False
+
+        reloads[self._entry_id] = now_ts
+        _LOGGER.warning(
+            "Centrometal watchdog: reloading config entry due to %s", reason
+        )
+        # Run the reload outside this task: unloading cancels our tick loop.
+        self._hass.async_create_task(
+            self._hass.config_entries.async_reload(self._entry_id)
+        )
+        return True
+
+    async def relogin(self) -> bool:
+        """Try to restore the websocket session after disconnect or bad refresh."""
+        # close_websocket() already logs and swallows its own failures.
+        await self.web_boiler_client.close_websocket()
         try:
             await self.web_boiler_client.http_client.close_session()
-        except Exception:
-            pass
+        except (ConnectionError, aiohttp.ClientError, asyncio.TimeoutError) as ex:
+            _LOGGER.debug("Centrometal close_session failed: %s", ex)
 
         relogin_successful = await self.web_boiler_client.relogin()
         if relogin_successful:
             await self.web_boiler_client.start_websocket(
                 self.on_parameter_updated
             )
-            ok = await self.web_boiler_client.refresh()
-            if ok:
-                self.last_refresh_timestamp = time.time()
+            if await self.web_boiler_client.refresh():
+                self._backoff_attempt = 0
+                return True
         else:
             _LOGGER.warning(
                 "WebBoilerSystem::tick failed to relogin %s",
                 self.web_boiler_client.username,
             )
+        self._backoff_attempt += 1
+        return False
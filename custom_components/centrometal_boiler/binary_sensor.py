@@ -8,8 +8,8 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.const import CONF_EMAIL
 
-from .common import format_name
-from .const import DOMAIN, WEB_BOILER_CLIENT
+from .common import format_name, get_entry_state
+from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -19,7 +19,7 @@ async def async_setup_entry(hass: HomeAssistant, config_entry, async_add_entitie
     entities = []
 
     unique_id = config_entry.data[CONF_EMAIL]
-    web_boiler_client = hass.data[DOMAIN][unique_id][WEB_BOILER_CLIENT]
+    web_boiler_client = hass.data[DOMAIN][unique_id].client
 
     for device in web_boiler_client.data.values():
         entities.append(WebBoilerWebsocketStatus(hass, web_boiler_client, device))
@@ -30,6 +30,10 @@ async def async_setup_entry(hass: HomeAssistant, config_entry, async_add_entitie
 class WebBoilerWebsocketStatus(BinarySensorEntity):
     """Binary sensor that reports if the websocket to Centrometal is connected."""
 
+    # No polling; updates are pushed.
+    _attr_should_poll = False
+    _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
+
     def __init__(self, hass: HomeAssistant, web_boiler_client, device) -> None:
         """Initialize the connectivity sensor."""
         super().__init__()
@@ -38,43 +42,27 @@ class WebBoilerWebsocketStatus(BinarySensorEntity):
         self.device = device
 
         self._serial = device["serial"]
-        self._unique_id = f"{self._serial}_websocket_status"
-        self._name = format_name(
+
+        # Static per entity; plain _attr_* values skip property dispatch on
+        # every state write (class-wide ones are set on the class).
+        self._attr_unique_id = f"{self._serial}_websocket_status"
+        self._attr_name = format_name(
             hass,
             device,
             "Centrometal Boiler System connection",
         )
 
-    async def async_added_to_hass(self):
-        """Subscribe to connectivity events from the client."""
-        self.web_boiler_client.set_connectivity_callback(self.update_callback)
-
-    @property
-    def name(self) -> str:
-        """Return entity name."""
-        return self._name
+        # Kept up to date by update_callback; seeded from the client so the
+        # first state write is already correct.
+        self._attr_is_on = bool(web_boiler_client.is_websocket_connected())
 
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID for this connection sensor."""
-        return self._unique_id
-
-    @property
-    def is_on(self) -> bool:
-        """Return True if the websocket is currently connected."""
-        return self.web_boiler_client.is_websocket_connected()
-
-    @property
-    def should_poll(self) -> bool:
-        """No polling; updates are pushed."""
-        return False
+    async def async_added_to_hass(self):
+        """Subscribe to connectivity events from the system."""
+        system = get_entry_state(self.hass, self.device).system
+        self.async_on_remove(system.add_connectivity_listener(self.update_callback))
 
     async def update_callback(self, status):
         """Called by the client on connectivity changes."""
-        # We just write our new state immediately.
+        # Remember the pushed status and write our new state immediately.
+        self._attr_is_on = bool(status)
         self.async_write_ha_state()
-
-    @property
-    def device_class(self):
-        """Expose this entity as a 'connectivity' binary sensor."""
-        return BinarySensorDeviceClass.CONNECTIVITY
@@ -1,9 +1,39 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from centrometal_web_boiler import WebBoilerClient
 from homeassistant.core import HomeAssistant
-from .const import DOMAIN, WEB_BOILER_CLIENT, WEB_BOILER_SYSTEM
+from .const import DOMAIN
 
 import homeassistant.util.dt as dt_util
 from datetime import datetime
 
+if TYPE_CHECKING:
+    from . import WebBoilerSystem
+
+
+@dataclass(slots=True)
+class EntryState:
+    """Per-account objects kept in hass.data[DOMAIN][username]."""
+
+    system: WebBoilerSystem
+    client: WebBoilerClient
+
+
+def get_entry_state(hass: HomeAssistant, device) -> EntryState:
+    """Return the EntryState owning device, cached on the device object.
+
+    Devices are recreated on every login, so the cached state can't outlive
+    the config entry it was looked up for.
+    """
+    state = getattr(device, "_centrometal_entry_state", None)
+    if state is None:
+        state = hass.data[DOMAIN][device.username]
+        device._centrometal_entry_state = state
+    return state
+
 
 def create_device_info(device) -> dict:
     param_power = device.get_parameter("B_sng")
@@ -33,14 +63,24 @@ def format_time(hass: HomeAssistant, timestamp, tzinfo=None):
     return dt.astimezone(tzinfo).strftime("%d.%m.%Y %H:%M:%S")
 
 
+def _name_prefix(hass: HomeAssistant, device) -> str:
+    """Return the text format_name puts before every name of this device.
+
+    It only depends on the account (prefix, device count), which is fixed
+    for the lifetime of the device object, so compute it once per device.
+    """
+    prefix = getattr(device, "_centrometal_name_prefix", None)
+    if prefix is None:
+        state = get_entry_state(hass, device)
+        prefix = ""
+        if len(state.system.prefix) > 0:
+            prefix = f"{state.system.prefix} "
+        if len(state.client.data.values()) > 1:
+            prefix = f"{prefix}{device['serial']} "
+        device._centrometal_name_prefix = prefix
+    return prefix
+
+
 def format_name(hass: HomeAssistant, device, name) -> str:
     name = name.replace("GMX EASY", "biotec")
-    username = device.username
-    serial = device["serial"]
-    web_boiler_client = hass.data[DOMAIN][username][WEB_BOILER_CLIENT]
-    web_boiler_system = hass.data[DOMAIN][username][WEB_BOILER_SYSTEM]
-    if len(web_boiler_client.data.values()) > 1:
-        name = f"{serial} {name}"
-    if len(web_boiler_system.prefix) > 0:
-        return f"{web_boiler_system.prefix} {name}"
-    return name
+    return f"{_name_prefix(hass, device)}{name}"
@@ -1,6 +1,13 @@
 DOMAIN = "centrometal_boiler"
-WEB_BOILER_CLIENT = "web_boiler_client"
-WEB_BOILER_SYSTEM = "web_boiler_system"
 
 WEB_BOILER_LOGIN_RETRY_INTERVAL = 60
+WEB_BOILER_LOGIN_RETRY_MAX_INTERVAL = 600
 WEB_BOILER_REFRESH_INTERVAL = 240
+
+# Watchdog: reload the config entry when no parameter changed for this long,
+# or when none arrived at all this long after start. Checked on every tick
+# (WEB_BOILER_REFRESH_INTERVAL). The first watchdog reload happens right away;
+# later ones of the same entry are at least the cooldown apart.
+WEB_BOILER_STALE_INTERVAL = 600
+WEB_BOILER_NO_DATA_INTERVAL = 240
+WEB_BOILER_RELOAD_COOLDOWN = 900
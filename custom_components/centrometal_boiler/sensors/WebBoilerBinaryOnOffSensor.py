@@ -11,13 +11,30 @@ We present them as "On" / "Off" instead of raw 0/1, and we also expose the
 raw_value attribute so you can inspect if the boiler ever sends richer data.
 """
 
-from typing import List
-
-from homeassistant.core import HomeAssistant
-from homeassistant.components.sensor import SensorEntity
-
 from .WebBoilerGenericSensor import WebBoilerGenericSensor
 
+# Raw values normalized to "ON" / "OFF" (True/False hash like 1/0).
+_ON_VALUES = frozenset({1, "1", "ON", "On", "on", "TRUE", "True", "true"})
+_OFF_VALUES = frozenset({0, "0", "OFF", "Off", "off", "FALSE", "False", "false"})
+
+# (param name, sensor_data) for every parameter exposed as On/Off.
+_BINARY_MAP = (
+    # Boiler run command / "command active"
+    ("B_CMD", (None, "mdi:state-machine", None, "Command Active")),
+    # PWM circulation pump
+    ("B_Ppwm", (None, "mdi:pump", None, "PWM Pump")),
+    # Main boiler / DHW circulation pump
+    ("B_P1", (None, "mdi:pump", None, "Hot Water Flow")),
+    # Electric backup heater
+    ("B_gri", (None, "mdi:meter-electric", None, "Electric Heater")),
+    # Fan activity flag from PelTec2 (web UI shows just running/not running)
+    ("B_fan01", (None, "mdi:fan", None, "Fan Active")),
+    # DHW / K1 circuit demand and pump state
+    ("K1B_onOff", (None, "mdi:pump", None, "DHW Pump Demand")),
+    ("K1B_P", (None, "mdi:pump", None, "DHW Pump State")),
+)
+BINARY_ON_OFF_SENSORS = dict(_BINARY_MAP)
+
 
 class WebBoilerBinaryOnOffSensor(WebBoilerGenericSensor):
     """Sensor that reports 'On' / 'Off' instead of raw 0/1, with debug."""
@@ -27,11 +44,11 @@ class WebBoilerBinaryOnOffSensor(WebBoilerGenericSensor):
         raw = self.parameter["value"]
 
         # Normalize obvious ON cases
-        if raw in (1, "1", "ON", "On", "on", True, "TRUE", "True", "true"):
+        if raw in _ON_VALUES:
             return "ON"
 
         # Normalize obvious OFF cases
-        if raw in (0, "0", "OFF", "Off", "off", False, "FALSE", "False", "false"):
+        if raw in _OFF_VALUES:
             return "OFF"
 
         # Try integer cast fallback (covers "2", etc.)
@@ -47,109 +64,10 @@ class WebBoilerBinaryOnOffSensor(WebBoilerGenericSensor):
         # Fallback: expose whatever came from the boiler
         return str(raw)
 
-    @property
-    def extra_state_attributes(self):
+    def _build_extra_state_attributes(self):
         """
         Extend base attributes from WebBoilerGenericSensor with raw_value for debugging.
         """
-        base = super().extra_state_attributes or {}
+        base = super()._build_extra_state_attributes()
         base["raw_value"] = self.parameter.get("value")
         return base
-
-
-def create_binary_state_entities(
-    hass: HomeAssistant,
-    device,
-) -> List[SensorEntity]:
-    """
-    Create 'On'/'Off' sensors for specific boiler parameters.
-
-    We:
-    - claim these parameters (mark them 'used' so they won't spawn duplicates),
-    - expose them via WebBoilerBinaryOnOffSensor,
-    - don't change control semantics.
-    """
-
-    entities: List[SensorEntity] = []
-
-    binary_map = {
-        # Boiler run command / "command active"
-        "B_CMD": [
-            None,
-            "mdi:state-machine",
-            None,
-            "Command Active",
-        ],
-
-        # PWM circulation pump
-        "B_Ppwm": [
-            None,
-            "mdi:pump",
-            None,
-            "PWM Pump",
-        ],
-
-        # Main boiler / DHW circulation pump
-        "B_P1": [
-            None,
-            "mdi:pump",
-            None,
-            "Hot Water Flow",
-        ],
-
-        # Electric backup heater
-        "B_gri": [
-            None,
-            "mdi:meter-electric",
-            None,
-            "Electric Heater",
-        ],
-
-        # Fan activity flag from PelTec2 (web UI shows just running/not running)
-        "B_fan01": [
-            None,
-            "mdi:fan",
-            None,
-            "Fan Active",
-        ],
-
-        # DHW / K1 circuit demand and pump state
-        "K1B_onOff": [
-            None,
-            "mdi:pump",
-            None,
-            "DHW Pump Demand",
-        ],
-        "K1B_P": [
-            None,
-            "mdi:pump",
-            None,
-            "DHW Pump State",
-        ],
-    }
-
-    params = device.get("parameters", {})
-
-    for param_name, sensor_data in binary_map.items():
-        if param_name not in params:
-            continue
-
-        parameter = device.get_parameter(param_name)
-
-        # If this parameter is already claimed, skip it
-        if parameter.get("used"):
-            continue
-
-        # Claim this parameter so other factories don't double-create it
-        parameter["used"] = True
-
-        entities.append(
-            WebBoilerBinaryOnOffSensor(
-                hass,
-                device,
-                sensor_data,
-                parameter,
-            )
-        )
-
-    return entities
@@ -5,9 +5,6 @@ from WebBoilerBinaryOnOffSensor, so we don't end up with two slightly
 different implementations fighting over the same parameters.
 """
 
-from .WebBoilerBinaryOnOffSensor import (
-    WebBoilerBinaryOnOffSensor,
-    create_binary_state_entities,
-)
+from .WebBoilerBinaryOnOffSensor import WebBoilerBinaryOnOffSensor
 
-__all__ = ["WebBoilerBinaryOnOffSensor", "create_binary_state_entities"]
+__all__ = ["WebBoilerBinaryOnOffSensor"]
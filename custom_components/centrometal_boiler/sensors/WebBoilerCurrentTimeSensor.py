@@ -5,10 +5,38 @@ from homeassistant.util.dt import UTC
 from .WebBoilerGenericSensor import WebBoilerGenericSensor
 from ..common import format_time
 
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+
+def _parse_boiler_time(raw_val) -> int | None:
+    """
+    Return B_Time as epoch seconds, or None if it can't be parsed.
+
+    8-digit or letter-containing hex strings are hex; other digit strings are
+    decimal. Deciding up front keeps a decimal value that happens to be valid
+    hex (e.g. "1730024286") from being read as hex.
+    """
+    if isinstance(raw_val, int):
+        return raw_val
+    s = str(raw_val).strip()
+    if s and all(c in _HEX_DIGITS for c in s) and (len(s) == 8 or not s.isdecimal()):
+        return int(s, 16)
+    # At most one leading "-": "--5" must not reach int().
+    if (s[1:] if s.startswith("-") else s).isdecimal():
+        return int(s)
+    return None
+
 
 class WebBoilerCurrentTimeSensor(WebBoilerGenericSensor):
     """Sensor that exposes the boiler's internal clock as a readable time."""
 
+    def __init__(self, hass: HomeAssistant, device, sensor_data, parameter) -> None:
+        super().__init__(hass, device, sensor_data, parameter)
+        # Last parsed raw value and its formatted time; reads between pushes
+        # return the cached string.
+        self._cached_raw = None
+        self._cached_formatted = None
+
     @property
     def native_value(self):
         """
@@ -19,34 +47,27 @@ class WebBoilerCurrentTimeSensor(WebBoilerGenericSensor):
         - decimal string (e.g. "1730024286")
         - "None"/invalid
 
-        We try hex, then decimal, then fall back to raw so the entity never crashes.
+        Unparseable values fall back to raw so the entity never crashes.
         """
         raw_val = self.parameter["value"]
 
         if raw_val is None or raw_val == "None":
             return raw_val
 
-        timestamp_seconds = None
-
-        # Try HEX -> int
-        try:
-            timestamp_seconds = int(raw_val, 16)
-        except (ValueError, TypeError):
-            timestamp_seconds = None
-
-        # Try DECIMAL -> int
-        if timestamp_seconds is None:
-            try:
-                timestamp_seconds = int(raw_val)
-            except (ValueError, TypeError):
-                timestamp_seconds = None
+        if raw_val == self._cached_raw:
+            return self._cached_formatted
 
+        timestamp_seconds = _parse_boiler_time(raw_val)
         if timestamp_seconds is None:
             # Can't parse? Just show raw.
-            return raw_val
+            formatted = raw_val
+        else:
+            # Format as human time in UTC for consistency
+            formatted = format_time(self.hass, timestamp_seconds, UTC)
 
-        # Format as human time in UTC for consistency
-        return format_time(self.hass, timestamp_seconds, UTC)
+        self._cached_raw = raw_val
+        self._cached_formatted = formatted
+        return formatted
 
     @staticmethod
     def create_entities(hass: HomeAssistant, device) -> list[SensorEntity]:
@@ -59,7 +80,7 @@ class WebBoilerCurrentTimeSensor(WebBoilerGenericSensor):
                     WebBoilerCurrentTimeSensor(
                         hass,
                         device,
-                        [None, "mdi:clock-outline", None, "Clock"],
+                        (None, "mdi:clock-outline", None, "Clock"),
                         parameter,
                     )
                 )
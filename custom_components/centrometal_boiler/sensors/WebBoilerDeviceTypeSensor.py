@@ -22,7 +22,7 @@ class WebBoilerDeviceTypeSensor(WebBoilerGenericSensor):
             WebBoilerDeviceTypeSensor(
                 hass,
                 device,
-                [None, "mdi:star-circle", None, "Device Type"],
+                (None, "mdi:star-circle", None, "Device Type"),
                 parameter,
             )
         ]
@@ -20,31 +20,37 @@ class WebBoilerFireGridSensor(WebBoilerGenericSensor):
         self.param_dir["used"] = True
         self.param_max["used"] = True
 
-    def __del__(self):
-        # Clean up callbacks on unload
-        super().__del__()
-        try:
-            self.param_dir.set_update_callback(None, "firegrid")
-        except Exception:
-            pass
-        try:
-            self.param_max.set_update_callback(None, "firegrid")
-        except Exception:
-            pass
+        # Signed % string, recomputed only when one of the three params changes.
+        self._cached_value = self._compute_value()
 
     async def async_added_to_hass(self):
         """Subscribe to sensor events."""
+        # Pick up pushes that arrived between __init__ and now.
+        self._cached_value = self._compute_value()
         await super().async_added_to_hass()
 
         # Also subscribe to direction and max so this entity updates when they change.
         self.param_dir.set_update_callback(self.update_callback, "firegrid")
         self.param_max.set_update_callback(self.update_callback, "firegrid")
 
+    async def async_will_remove_from_hass(self) -> None:
+        """Unsubscribe from direction and max as well."""
+        await super().async_will_remove_from_hass()
+        self.param_dir.set_update_callback(None, "firegrid")
+        self.param_max.set_update_callback(None, "firegrid")
+
+    async def update_callback(self, _param) -> None:
+        """Refresh the cached position, then schedule the state write."""
+        self._cached_value = self._compute_value()
+        await super().update_callback(_param)
+
     @property
     def native_value(self):
-        """
-        Return signed % position of the fire grid.
+        """Return signed % position of the fire grid."""
+        return self._cached_value
 
+    def _compute_value(self) -> str:
+        """
         pct = int(Ind * 100 / Max)
         sign = '+' if Dir > 0 else '-'
         """
@@ -61,16 +67,22 @@ class WebBoilerFireGridSensor(WebBoilerGenericSensor):
         pct = int(value_ind * 100 / value_max)
         return f"+{pct}" if value_dir > 0 else f"-{pct}"
 
-    @property
-    def extra_state_attributes(self):
+    def _attributes_key(self):
+        """Also rebuild attributes when direction or max change."""
+        return (
+            super()._attributes_key(),
+            self._fingerprint(self.param_dir),
+            self._fingerprint(self.param_max),
+        )
+
+    def _build_extra_state_attributes(self):
         """
         Return debug fields as attributes.
 
         We expose the raw Ind / Max / Dir alongside the parent attributes
         (Last updated, Original name, etc.).
         """
-        base = super().extra_state_attributes or {}
-        attrs = dict(base)
+        attrs = super()._build_extra_state_attributes()
         attrs["Ind"] = self.parameter["value"]
         attrs["Max"] = self.param_max["value"]
         attrs["Dir"] = self.param_dir["value"]
@@ -100,7 +112,7 @@ class WebBoilerFireGridSensor(WebBoilerGenericSensor):
             WebBoilerFireGridSensor(
                 hass,
                 device,
-                ["", "mdi:grid", None, "Fire Grid Position"],
+                ("", "mdi:grid", None, "Fire Grid Position"),
                 param_ind,
                 param_dir,
                 param_max,
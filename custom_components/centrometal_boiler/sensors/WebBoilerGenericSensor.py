@@ -4,17 +4,23 @@ from typing import List, Dict, Any
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.core import HomeAssistant
 
-from ..const import DOMAIN, WEB_BOILER_CLIENT, WEB_BOILER_SYSTEM
-from ..common import format_name, format_time, create_device_info
-
-from .generic_sensors_all import (
-    GENERIC_SENSORS_COMMON,
-    get_generic_temperature_settings_sensors,
+from ..common import (
+    create_device_info,
+    format_name,
+    format_time,
+    get_entry_state,
 )
-from .generic_sensors_peltec import PELTEC_GENERIC_SENSORS
+
+from .generic_sensors_all import get_generic_temperature_settings_sensors
 
 _LOGGER = logging.getLogger(__name__)
 
+# Parameter pushes arriving within this many seconds share one state write.
+_WRITE_COALESCE_DELAY = 0.05
+
+# Marks a cache slot that has never been filled (None is a valid timestamp).
+_UNSET = object()
+
 
 class WebBoilerGenericSensor(SensorEntity):
     """
@@ -26,14 +32,18 @@ class WebBoilerGenericSensor(SensorEntity):
     - Marks claimed parameters as 'used' so we don't create dup sensors
     """
 
+    # Push-updated; a class-level _attr_ avoids a property call per state write.
+    _attr_should_poll = False
+
     def __init__(self, hass: HomeAssistant, device, sensor_data, parameter) -> None:
         """
-        sensor_data: [unit, icon, device_class, description, optional attributes_map]
+        sensor_data: (unit, icon, device_class, description, optional attributes_map)
         parameter:   boiler param object (value, timestamp, set_update_callback, ...)
         """
         self.hass = hass
-        self.web_boiler_client = hass.data[DOMAIN][device.username][WEB_BOILER_CLIENT]
-        self.web_boiler_system = hass.data[DOMAIN][device.username][WEB_BOILER_SYSTEM]
+        state = get_entry_state(hass, device)
+        self.web_boiler_client = state.client
+        self.web_boiler_system = state.system
 
         self.device = device
         self.parameter = parameter
@@ -50,6 +60,8 @@ class WebBoilerGenericSensor(SensorEntity):
 
         self._name = format_name(hass, device, f"{self._product} {self._description}")
         self._unique_id = f"{self._serial}-{self._param_name}"
+        # Static for the entity's lifetime; build the registry dict once.
+        self._device_info = create_device_info(device)
 
         # Unique callback ID per entity so two entities pointing to the same
         # boiler parameter cannot stomp each other's callback. This fixed the
@@ -58,17 +70,27 @@ class WebBoilerGenericSensor(SensorEntity):
 
         self.added_to_hass = False
 
+        # Pending coalesced state write (see update_callback).
+        self._write_handle = None
+        # _snapshot() at the last write; identical pushes are not re-written.
+        self._last_published = _UNSET
+
+        # extra_state_attributes, rebuilt only when _attributes_key() changes.
+        self._attrs_key = _UNSET
+        self._attrs_cache: Dict[str, Any] = {}
+
         # Mark this parameter (and any attribute parameters) as "used"
         # so we don't create multiple entities for the same physical value.
         self.parameter["used"] = True
-        for attr_param_name in self._attributes_map:
-            attr_param = self.device.get_parameter(attr_param_name)
+        # (nice label, parameter) for each attribute mapped in sensor_data[4]
+        self._mapped_params = []
+        params = device["parameters"]
+        for attr_param_name, nice_label in self._attributes_map.items():
+            attr_param = params.get(attr_param_name)
+            if attr_param is None:
+                attr_param = device.get_parameter(attr_param_name)
             attr_param["used"] = True
-
-    def __del__(self):
-        # Clean up websocket callback on entity removal.
-        if hasattr(self.parameter, "set_update_callback"):
-            self.parameter.set_update_callback(None, self._callback_id)
+            self._mapped_params.append((nice_label, attr_param))
 
     async def async_added_to_hass(self):
         """Subscribe to updates for this parameter."""
@@ -76,15 +98,51 @@ class WebBoilerGenericSensor(SensorEntity):
         self.async_schedule_update_ha_state(False)
         if hasattr(self.parameter, "set_update_callback"):
             self.parameter.set_update_callback(self.update_callback, self._callback_id)
-
-    @property
-    def should_poll(self) -> bool:
-        return False
+        self.async_on_remove(
+            self.web_boiler_system.add_connectivity_listener(
+                self._async_connectivity_changed
+            )
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Unsubscribe and drop a state write that is still pending."""
+        if hasattr(self.parameter, "set_update_callback"):
+            self.parameter.set_update_callback(None, self._callback_id)
+        if self._write_handle is not None:
+            self._write_handle.cancel()
+            self._write_handle = None
 
     async def update_callback(self, _param) -> None:
-        """Called by boiler lib when this parameter changes."""
+        """Called by boiler lib when this parameter changes.
+
+        A burst of pushes (several subscribed params in one frame) is
+        collapsed into a single state write shortly after the first one.
+        """
+        if self._write_handle is not None:
+            return
+        if self._snapshot() == self._last_published:
+            return
+        self._write_handle = self.hass.loop.call_later(
+            _WRITE_COALESCE_DELAY, self._flush_state
+        )
+
+    async def _async_connectivity_changed(self, _connected: bool) -> None:
+        """Republish availability; always writes, whatever the snapshot says."""
+        if self._write_handle is None:
+            self._write_handle = self.hass.loop.call_later(
+                _WRITE_COALESCE_DELAY, self._flush_state
+            )
+
+    def _flush_state(self) -> None:
+        """Write the coalesced state."""
+        self._write_handle = None
+        self._last_published = self._snapshot()
         self.async_write_ha_state()
 
+    def _snapshot(self) -> tuple:
+        """Everything a state write publishes: availability, value, attributes."""
+        return (self.available, self.native_value, self._attributes_key())
+
     @property
     def name(self) -> str:
         return self._name
@@ -111,11 +169,36 @@ class WebBoilerGenericSensor(SensorEntity):
 
     @property
     def available(self) -> bool:
-        return self.web_boiler_client.is_websocket_connected()
+        # Flag kept current by the system's connectivity callback.
+        return self.web_boiler_system.websocket_connected
+
+    @staticmethod
+    def _fingerprint(parameter) -> tuple:
+        """Return what changes whenever a parameter is updated."""
+        return (parameter.get("timestamp"), parameter.get("value"))
+
+    def _attributes_key(self) -> tuple:
+        """
+        Return the inputs of _build_extra_state_attributes(); attributes are
+        only rebuilt when this changes. Subclasses add their extra params.
+        """
+        fingerprint = self._fingerprint
+        return (
+            fingerprint(self.parameter),
+            *[fingerprint(p) for _, p in self._mapped_params],
+        )
 
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Expose boiler timestamp + any linked attributes."""
+        key = self._attributes_key()
+        if key != self._attrs_key:
+            self._attrs_cache = self._build_extra_state_attributes()
+            self._attrs_key = key
+        return self._attrs_cache
+
+    def _build_extra_state_attributes(self) -> Dict[str, Any]:
+        """Build the attributes served (cached) by extra_state_attributes."""
         attrs: Dict[str, Any] = {}
 
         # Boiler-provided timestamp
@@ -130,15 +213,14 @@ class WebBoilerGenericSensor(SensorEntity):
         attrs["Original name"] = self.parameter["name"]
 
         # Attributes mapped in sensor_data[4]
-        for key_param_name, nice_label in self._attributes_map.items():
-            p = self.device.get_parameter(key_param_name)
+        for nice_label, p in self._mapped_params:
             attrs[nice_label] = p["value"] or "None"
 
         return attrs
 
     @property
     def device_info(self):
-        return create_device_info(self.device)
+        return self._device_info
 
     #
     # ---- helpers used by other sensor classes ----
@@ -154,30 +236,6 @@ class WebBoilerGenericSensor(SensorEntity):
     # ---- factories that build groups of entities ----
     #
 
-    @staticmethod
-    def create_common_entities(hass: HomeAssistant, device) -> List[SensorEntity]:
-        """
-        Create sensors for generic/identity params that are common.
-
-        We SKIP any params that are handled as On/Off in WebBoilerBinaryOnOffSensor
-        (like B_CMD) so we don't double-create and stomp callbacks.
-        """
-        skip_params = {
-            "B_CMD",  # handled as "Command Active" On/Off
-        }
-
-        entities: List[SensorEntity] = []
-        for param_id, sensor_data in GENERIC_SENSORS_COMMON.items():
-            if param_id in skip_params:
-                continue
-            if not WebBoilerGenericSensor._device_has_parameter(device, param_id):
-                continue
-            parameter = device.get_parameter(param_id)
-            if parameter.get("used"):
-                continue
-            entities.append(WebBoilerGenericSensor(hass, device, sensor_data, parameter))
-        return entities
-
     @staticmethod
     def create_temperatures_entities(hass: HomeAssistant, device) -> List[SensorEntity]:
         """
@@ -185,72 +243,20 @@ class WebBoilerGenericSensor(SensorEntity):
         """
         entities: List[SensorEntity] = []
         temp_sensors = get_generic_temperature_settings_sensors(device)
+        params = device.get("parameters", {})
         for param_id, sensor_data in temp_sensors.items():
-            if not WebBoilerGenericSensor._device_has_parameter(device, param_id):
+            if param_id not in params:
                 continue
-            parameter = device.get_parameter(param_id)
+            parameter = params[param_id]
             if parameter.get("used"):
                 continue
             entities.append(WebBoilerGenericSensor(hass, device, sensor_data, parameter))
         return entities
 
-    @staticmethod
-    def create_conf_entities(hass: HomeAssistant, device) -> List[SensorEntity]:
-        """
-        Return configuration/status sensors based on boiler type.
-
-        We are only interested in PelTec II Lambda ("peltec2"). All other boiler
-        types are out of scope and will just produce no extra sensors.
-        """
-        entities: List[SensorEntity] = []
-
-        if device["type"] == "peltec2":
-            generic_map = PELTEC_GENERIC_SENSORS
-
-            # We skip params that are either:
-            # - handled by other dedicated sensor classes
-            # - removed on purpose (clock, ping, legacy tank level)
-            # - not meant to become standalone sensors
-            skip_params = {
-                # handled by binary on/off:
-                "B_CMD",
-                "K1B_onOff",
-                "K1B_P",
-
-                # handled by WebBoilerConfigurationSensor:
-                "B_KONF",
-
-                # handled by WebBoilerFireGridSensor:
-                "B_resInd",
-                "B_resDir",
-                "B_resMax",
-
-                # legacy / removed:
-                "B_Time",
-                "B_razina",
-                "PING",
-            }
-        else:
-            # non-peltec devices => no extras in our build
-            generic_map = {}
-            skip_params = set()
-
-        for param_id, sensor_data in generic_map.items():
-            if param_id in skip_params:
-                continue
-            if not WebBoilerGenericSensor._device_has_parameter(device, param_id):
-                continue
-            parameter = device.get_parameter(param_id)
-            if parameter.get("used"):
-                continue
-            entities.append(WebBoilerGenericSensor(hass, device, sensor_data, parameter))
-
-        return entities
-
     @staticmethod
     def create_unknown_entities(hass: HomeAssistant, device) -> List[SensorEntity]:
         """
         We do NOT create "Unknown ..." catch-all sensors anymore.
-        Keep HA device list clean.
+        Keep HA device list clean; setup no longer calls this.
         """
         return []
@@ -8,6 +8,24 @@ from .WebBoilerGenericSensor import WebBoilerGenericSensor
 
 _LOGGER = logging.getLogger(__name__)
 
+_CELSIUS = UnitOfTemperature.CELSIUS
+_TEMPERATURE = SensorDeviceClass.TEMPERATURE
+
+# Per-circuit parameters: (suffix, unit, icon, device class, label).
+# The label is appended to the circuit name ("Circuit 1", "Circuit 1K", ...).
+_CIRCUIT_TEMPLATE = (
+    ("_CircType", None, "mdi:view-list", None, " Heating Type"),
+    ("_dayNight", None, "mdi:view-list", None, " Day Night Mode"),
+    ("_kor", _CELSIUS, "mdi:thermometer", _TEMPERATURE, " Room Target Correction"),
+    ("_korType", None, "mdi:view-list", None, " Correction Type"),
+    ("_onOff", None, "mdi:pump", None, " Pump Demand"),
+    ("_P", None, "mdi:pump", None, " Pump"),
+    ("_Tpol", _CELSIUS, "mdi:thermometer", _TEMPERATURE, " Flow Target Temperature"),
+    ("_Tpol1", _CELSIUS, "mdi:thermometer", _TEMPERATURE, " Flow Measured Temperature"),
+    ("_Tsob", _CELSIUS, "mdi:thermometer", _TEMPERATURE, " Room Target Temperature"),
+    ("_Tsob1", _CELSIUS, "mdi:thermometer", _TEMPERATURE, " Room Measured Temperature"),
+)
+
 
 class WebBoilerHeatingCircuitSensor:
     """
@@ -27,11 +45,16 @@ class WebBoilerHeatingCircuitSensor:
         """Scan for circuit prefixes and build sensor entities."""
         entities: list[SensorEntity] = []
 
+        # All circuit prefixes are 3 chars; collect the present ones in one pass.
+        prefixes_present = {
+            param[:3] for param in device["parameters"] if len(param) >= 3
+        }
+
         # Classic circuits C1B..C4B
         for i in range(1, 5):
             prefix = f"C{i}B"
             name = f"Circuit {i}"
-            if WebBoilerHeatingCircuitSensor.device_has_prefix(device, prefix):
+            if prefix in prefixes_present:
                 entities.extend(
                     WebBoilerHeatingCircuitSensor.create_heating_circuit_entities(
                         hass, device, prefix, name
@@ -42,7 +65,7 @@ class WebBoilerHeatingCircuitSensor:
         for i in range(1, 5):
             prefix = f"K{i}B"
             name = f"Circuit {i}K"
-            if WebBoilerHeatingCircuitSensor.device_has_prefix(device, prefix):
+            if prefix in prefixes_present:
                 entities.extend(
                     WebBoilerHeatingCircuitSensor.create_heating_circuit_entities(
                         hass, device, prefix, name
@@ -54,10 +77,7 @@ class WebBoilerHeatingCircuitSensor:
     @staticmethod
     def device_has_prefix(device, prefix):
         """Returns True if the boiler exposes any parameters starting with this prefix."""
-        for param in device["parameters"].keys():
-            if param.startswith(prefix):
-                return True
-        return False
+        return any(param.startswith(prefix) for param in device["parameters"])
 
     @staticmethod
     def create_heating_circuit_entities(
@@ -71,80 +91,22 @@ class WebBoilerHeatingCircuitSensor:
         """
         entities: list[SensorEntity] = []
 
-        items: dict[str, list] = {}
-        items[prefix + "_CircType"] = [
-            None,
-            "mdi:view-list",
-            None,
-            name + " Heating Type",
-        ]
-        items[prefix + "_dayNight"] = [
-            None,
-            "mdi:view-list",
-            None,
-            name + " Day Night Mode",
-        ]
-        items[prefix + "_kor"] = [
-            UnitOfTemperature.CELSIUS,
-            "mdi:thermometer",
-            SensorDeviceClass.TEMPERATURE,
-            name + " Room Target Correction",
-        ]
-        items[prefix + "_korType"] = [
-            None,
-            "mdi:view-list",
-            None,
-            name + " Correction Type",
-        ]
-        items[prefix + "_onOff"] = [
-            None,
-            "mdi:pump",
-            None,
-            name + " Pump Demand",
-        ]
-        items[prefix + "_P"] = [
-            None,
-            "mdi:pump",
-            None,
-            name + " Pump",
-        ]
-        items[prefix + "_Tpol"] = [
-            UnitOfTemperature.CELSIUS,
-            "mdi:thermometer",
-            SensorDeviceClass.TEMPERATURE,
-            name + " Flow Target Temperature",
-        ]
-        items[prefix + "_Tpol1"] = [
-            UnitOfTemperature.CELSIUS,
-            "mdi:thermometer",
-            SensorDeviceClass.TEMPERATURE,
-            name + " Flow Measured Temperature",
-        ]
-        items[prefix + "_Tsob"] = [
-            UnitOfTemperature.CELSIUS,
-            "mdi:thermometer",
-            SensorDeviceClass.TEMPERATURE,
-            name + " Room Target Temperature",
-        ]
-        items[prefix + "_Tsob1"] = [
-            UnitOfTemperature.CELSIUS,
-            "mdi:thermometer",
-            SensorDeviceClass.TEMPERATURE,
-            name + " Room Measured Temperature",
-        ]
-
-        for param_id, sensor_data in items.items():
-            if not WebBoilerGenericSensor._device_has_parameter(device, param_id):
+        params = device.get("parameters", {})
+        for suffix, unit, icon, device_class, label in _CIRCUIT_TEMPLATE:
+            param_id = prefix + suffix
+            if param_id not in params:
                 continue
 
-            parameter = device.get_parameter(param_id)
+            parameter = params[param_id]
 
             # If already claimed by a dedicated sensor (binary On/Off, etc.), skip.
             if parameter.get("used"):
                 continue
 
             entities.append(
-                WebBoilerGenericSensor(hass, device, sensor_data, parameter)
+                WebBoilerGenericSensor(
+                    hass, device, (unit, icon, device_class, name + label), parameter
+                )
             )
 
         return entities
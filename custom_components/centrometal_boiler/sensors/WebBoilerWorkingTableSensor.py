@@ -6,6 +6,8 @@ from homeassistant.core import HomeAssistant
 from .WebBoilerGenericSensor import WebBoilerGenericSensor
 from centrometal_web_boiler.WebBoilerDeviceCollection import WebBoilerParameter
 
+_DAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
 
 class WebBoilerWorkingTableSensor(WebBoilerGenericSensor):
     """
@@ -19,25 +21,26 @@ class WebBoilerWorkingTableSensor(WebBoilerGenericSensor):
         super().__init__(hass, device, sensor_data, param_status)
         self.param_tables = param_tables
 
+        # Direct refs to every PVAL_<key>_<slot> parameter, by table key and
+        # slot number, so attribute reads don't rebuild names and look them up.
+        self._slot_params: dict[str, dict[int, dict]] = {}
+
         # Mark all PVAL_* parameters as "used" so they don't get exposed
-        # later as separate generic sensors.
-        for key in self.param_tables:
-            for val in self.param_tables[key]:
-                name = f"PVAL_{key}_{val}"
-                parameter = self.device.get_parameter(name)
-                parameter["used"] = True
-
-    def __del__(self):
-        super().__del__()
-        # Remove callbacks on GC/unload for each PVAL entry
-        self.set_callback_to_all_table_parameters(None)
+        # later as separate generic sensors. Slot names come from the
+        # device's own keys, so index the parameters dict directly.
+        params = self.device["parameters"]
+        for key, vals in self.param_tables.items():
+            slots = self._slot_params[key] = {}
+            for val in vals:
+                parameter = params.get(f"PVAL_{key}_{val}")
+                if parameter is not None:
+                    parameter["used"] = True
+                    slots[int(val)] = parameter
 
     def set_callback_to_all_table_parameters(self, callback):
         """Subscribe/unsubscribe to all table parameters for live updates."""
-        for key in self.param_tables:
-            for val in self.param_tables[key]:
-                name = f"PVAL_{key}_{val}"
-                parameter = self.device.get_parameter(name)
+        for key, slots in self._slot_params.items():
+            for parameter in slots.values():
                 parameter.set_update_callback(callback, f"table_{key}")
 
     async def async_added_to_hass(self):
@@ -46,30 +49,47 @@ class WebBoilerWorkingTableSensor(WebBoilerGenericSensor):
         # When any PVAL_* value changes, update this entity
         self.set_callback_to_all_table_parameters(self.update_callback)
 
+    async def async_will_remove_from_hass(self) -> None:
+        """Unsubscribe from every PVAL entry as well."""
+        await super().async_will_remove_from_hass()
+        self.set_callback_to_all_table_parameters(None)
+
     def getValue(self, table_key, dayIndex, i):
         """Return a single minute-of-day value from a PVAL_* slot."""
-        name = "PVAL_" + table_key + "_" + str(dayIndex * 6 + i)
-        parameter = self.device.get_parameter(name)
-        if "value" in parameter.keys():
-            value = parameter["value"]
-            return int(value)
-        return 0
+        parameter = self._slot_params[table_key].get(dayIndex * 6 + i)
+        if parameter is None:
+            return 0
+        return int(parameter.get("value", 0) or 0)
 
     def format_time(self, val):
         """Convert minutes-from-midnight to HH:MM."""
-        return "%02d:%02d" % (int(val / 60), val % 60)
+        hours, minutes = divmod(val, 60)
+        return f"{hours:02d}:{minutes:02d}"
 
     def get_range(self, tableIndex, dayIndex, i, j):
         """Return a human-readable range like 06:00-08:30, or ' - ' if disabled."""
-        val1 = self.getValue(tableIndex, dayIndex, i)
-        val2 = self.getValue(tableIndex, dayIndex, j)
+        get_value = self.getValue
+        val1 = get_value(tableIndex, dayIndex, i)
+        val2 = get_value(tableIndex, dayIndex, j)
         # 1440/1440 = disabled slot in Centrometal's schedule format
         if val1 == 1440 and val2 == 1440:
             return " - "
-        return self.format_time(val1) + "-" + self.format_time(val2)
-
-    @property
-    def extra_state_attributes(self):
+        format_time = self.format_time
+        return f"{format_time(val1)}-{format_time(val2)}"
+
+    def _attributes_key(self):
+        """Also rebuild attributes when any schedule slot changes."""
+        fingerprint = self._fingerprint
+        return (
+            super()._attributes_key(),
+            *[
+                fingerprint(parameter)
+                for slots in self._slot_params.values()
+                for parameter in slots.values()
+            ],
+        )
+
+    def _build_extra_state_attributes(self):
         """
         Return schedule tables as attributes.
 
@@ -77,20 +97,14 @@ class WebBoilerWorkingTableSensor(WebBoilerGenericSensor):
         - base attributes from parent (Last updated, Original name)
         - for each weekday, up to 3 active ranges
         """
-        base = super().extra_state_attributes or {}
-        attributes = dict(base)
-
-        days = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+        attributes = super()._build_extra_state_attributes()
 
+        get_range = self.get_range
         for key in self.param_tables:
-            for day_idx in range(0, 7):
-                day_name = days[day_idx]
-                ranges = [
-                    self.get_range(key, day_idx, 0, 1),
-                    self.get_range(key, day_idx, 2, 3),
-                    self.get_range(key, day_idx, 4, 5),
-                ]
-                attributes[f"Table{key} {day_name}"] = " / ".join(ranges)
+            for day_idx, day_name in enumerate(_DAYS):
+                attributes[f"Table{key} {day_name}"] = " / ".join(
+                    get_range(key, day_idx, i, i + 1) for i in (0, 2, 4)
+                )
 
         return attributes
 
@@ -100,17 +114,15 @@ class WebBoilerWorkingTableSensor(WebBoilerGenericSensor):
         Group PVAL_x_y parameters by x, and collect/sort all y values for each x.
         Returns an OrderedDict of {table_key: [slot_indexes...]}.
         """
-        pval = {}
-        for key in device["parameters"].keys():
+        pval = collections.defaultdict(set)
+        for key in device["parameters"]:
             if key.startswith("PVAL_"):
                 data = key[5:].split("_")
                 if len(data) == 2:
-                    if data[0] not in pval:
-                        pval[data[0]] = []
-                    if data[1] not in pval[data[0]]:
-                        pval[data[0]].append(data[1])
-                        pval[data[0]].sort(key=int)
-        return collections.OrderedDict(sorted(pval.items()))
+                    pval[data[0]].add(data[1])
+        return collections.OrderedDict(
+            (table, sorted(pval[table], key=int)) for table in sorted(pval)
+        )
 
     @staticmethod
     def create_entities(hass: HomeAssistant, device) -> list[SensorEntity]:
@@ -129,7 +141,7 @@ class WebBoilerWorkingTableSensor(WebBoilerGenericSensor):
                     WebBoilerWorkingTableSensor(
                         hass,
                         device,
-                        [None, "mdi:state-machine", None, "Table " + key],
+                        (None, "mdi:state-machine", None, "Table " + key),
                         parameter,
                         {key: value},
                     )
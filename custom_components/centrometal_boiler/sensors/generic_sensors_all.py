@@ -6,26 +6,16 @@ from homeassistant.const import UnitOfTemperature
 # we skip creating a generic sensor for B_CMD because we expose it via
 # WebBoilerBinaryOnOffSensor as a nice "On"/"Off" state.
 GENERIC_SENSORS_COMMON = {
-    "B_STATE": [None, "mdi:state-machine", None, "Boiler State"],
-    "B_CMD": [None, "mdi:state-machine", None, "Command Active"],
-    "B_BRAND": [None, "mdi:information", None, "Brand"],
-    "B_INST": [None, "mdi:information", None, "Installation"],
-    "B_PRODNAME": [None, "mdi:information", None, "Product Name"],
-    "B_VER": [None, "mdi:information", None, "Firmware Version"],
-    "B_sng": [None, "mdi:information", None, "Nominal Power"],
+    "B_STATE": (None, "mdi:state-machine", None, "Boiler State"),
+    "B_CMD": (None, "mdi:state-machine", None, "Command Active"),
+    "B_BRAND": (None, "mdi:information", None, "Brand"),
+    "B_INST": (None, "mdi:information", None, "Installation"),
+    "B_PRODNAME": (None, "mdi:information", None, "Product Name"),
+    "B_VER": (None, "mdi:information", None, "Firmware Version"),
+    "B_sng": (None, "mdi:information", None, "Nominal Power"),
 }
 
 
-def _device_really_has_parameter(device, param_name: str) -> bool:
-    """Return True only if param_name is present in device['parameters']."""
-    return (
-        isinstance(device, dict)
-        and "parameters" in device
-        and isinstance(device["parameters"], dict)
-        and param_name in device["parameters"]
-    )
-
-
 def get_generic_temperature_settings_sensors(device):
     """
     Return sensors for configurable temperature setpoints (PVAL_xxx_0).
@@ -33,31 +23,33 @@ def get_generic_temperature_settings_sensors(device):
     We also attach Default / Minimum / Maximum from PDEF_xxx_0 / PMIN_xxx_0 /
     PMAX_xxx_0 if present, so each HA sensor exposes target temp plus limits.
     """
-    temperature_settings: dict[str, list] = {}
+    params = device.get("parameters") or {}
+    if not isinstance(params, dict):
+        return {}
+
+    temperature_settings: dict[str, tuple] = {}
     for value in device.get("temperatures", {}).values():
         dbindex = value["dbindex"]
 
         value_param_name = f"PVAL_{dbindex}_0"
-        default_param_name = f"PDEF_{dbindex}_0"
-        min_param_name = f"PMIN_{dbindex}_0"
-        max_param_name = f"PMAX_{dbindex}_0"
-
-        if not _device_really_has_parameter(device, value_param_name):
+        if value_param_name not in params:
             continue
 
-        attributes: dict[str, str] = {}
-        if _device_really_has_parameter(device, default_param_name):
-            attributes[default_param_name] = "Default"
-        if _device_really_has_parameter(device, min_param_name):
-            attributes[min_param_name] = "Minimum"
-        if _device_really_has_parameter(device, max_param_name):
-            attributes[max_param_name] = "Maximum"
-
-        temperature_settings[value_param_name] = [
+        attributes: dict[str, str] = {
+            name: label
+            for name, label in (
+                (f"PDEF_{dbindex}_0", "Default"),
+                (f"PMIN_{dbindex}_0", "Minimum"),
+                (f"PMAX_{dbindex}_0", "Maximum"),
+            )
+            if name in params
+        }
+
+        temperature_settings[value_param_name] = (
             UnitOfTemperature.CELSIUS,
             "mdi:thermometer",
             SensorDeviceClass.TEMPERATURE,
             value["naslov"],
             attributes,
-        ]
+        )
     return temperature_settings
@@ -6,30 +6,35 @@ from homeassistant.const import CONF_EMAIL
 from .switches.WebBoilerPowerSwitch import WebBoilerPowerSwitch
 from .switches.WebBoilerCircuitSwitch import WebBoilerCircuitSwitch
 
-from .const import DOMAIN, WEB_BOILER_CLIENT
+from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# Boiler types whose main power can be switched from the web API.
+_POWER_SWITCH_TYPES = frozenset({"peltec2", "cmpelet", "biopl"})
+
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """Set up the switches platform."""
-    entities = []
     unique_id = config_entry.data[CONF_EMAIL]
-    web_boiler_client = hass.data[DOMAIN][unique_id][WEB_BOILER_CLIENT]
-
-    for device in web_boiler_client.data.values():
-        if device["type"] in ("peltec2", "cmpelet", "biopl"):
-            entities.append(WebBoilerPowerSwitch(hass, device))
-
-        for circuit in device["circuits"].values():
-            entities.append(
-                WebBoilerCircuitSwitch(
-                    hass,
-                    device,
-                    circuit["naslov"],
-                    circuit["dbindex"],
-                )
-            )
+    web_boiler_client = hass.data[DOMAIN][unique_id].client
+    devices = list(web_boiler_client.data.values())
+
+    entities = [
+        WebBoilerPowerSwitch(hass, device)
+        for device in devices
+        if device["type"] in _POWER_SWITCH_TYPES
+    ]
+    entities.extend(
+        WebBoilerCircuitSwitch(
+            hass,
+            device,
+            circuit["naslov"],
+            circuit["dbindex"],
+        )
+        for device in devices
+        for circuit in device["circuits"].values()
+    )
 
     _LOGGER.debug(
         "Adding boiler control as switch: %s (%s)", entities, web_boiler_client.username
@@ -1,23 +1,43 @@
-import asyncio
 from datetime import datetime
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_CORE_CONFIG_UPDATE
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.components.switch import SwitchEntity
 import homeassistant.util.dt as dt_util
 
 # pylint: disable=relative-beyond-top-level
-from ..const import DOMAIN, WEB_BOILER_CLIENT
-from ..common import create_device_info, format_name
+from ..common import create_device_info, format_name, get_entry_state
+
+# "Last updated" attribute format.
+_TS_FMT = "%d.%m.%Y %H:%M:%S"
+
+
+def _coerce_int(value: Any) -> int | None:
+    """Return value as an int, or None if the boiler sent something unparsable."""
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
 
 
 class WebBoilerCircuitSwitch(SwitchEntity):
     """Representation of an individual heating circuit on/off switch."""
 
+    # (role, parameter prefix) of the PXXX_<dbindex>_0 params behind a circuit
+    _PARAM_SUFFIXES = (
+        ("def", "PDEF"),
+        ("state", "PVAL"),
+        ("off", "PMIN"),
+        ("on", "PMAX"),
+    )
+
     def __init__(self, hass: HomeAssistant, device, naslov, dbindex) -> None:
         """Initialize the circuit switch."""
         self.hass = hass
-        self.web_boiler_client = hass.data[DOMAIN][device.username][WEB_BOILER_CLIENT]
+        state = get_entry_state(hass, device)
+        self.web_boiler_client = state.client
+        self.web_boiler_system = state.system
         self._device = device
         self._product = device["product"]
         self._serial = device["serial"]
@@ -25,6 +45,8 @@ class WebBoilerCircuitSwitch(SwitchEntity):
         # UI/HA identity
         self._name = format_name(hass, device, naslov)
         self._unique_id = f"{self._serial}_switch_{dbindex}"
+        # Static for the entity's lifetime; build the registry dict once.
+        self._device_info = create_device_info(device)
 
         # Internal state tracking
         self._state = None
@@ -32,45 +54,61 @@ class WebBoilerCircuitSwitch(SwitchEntity):
         self._dbindex = dbindex
         self._table_key = f"table_{dbindex}_switch"
 
-        # Parameter names for this circuit
-        self._param_name_def = f"PDEF_{dbindex}_0"
-        self._param_name_state = f"PVAL_{dbindex}_0"
-        self._param_name_off = f"PMIN_{dbindex}_0"
-        self._param_name_on = f"PMAX_{dbindex}_0"
+        # Resolved once; refreshed if the HA time zone is changed at runtime.
+        self._tzinfo = dt_util.get_time_zone(hass.config.time_zone)
+
+        # extra_state_attributes, rebuilt after the next param update.
+        self._attrs_cache: dict[str, Any] | None = None
 
-        # Live parameter objects from the device
-        self._param_def = self._device.get_parameter(self._param_name_def)
-        self._param_state = self._device.get_parameter(self._param_name_state)
-        self._param_off = self._device.get_parameter(self._param_name_off)
-        self._param_on = self._device.get_parameter(self._param_name_on)
+        # Live parameter objects from the device, by role
+        self._params = {
+            role: device.get_parameter(f"{prefix}_{dbindex}_0")
+            for role, prefix in self._PARAM_SUFFIXES
+        }
 
         # Mark these parameters as "used" so they don't get exposed as "unknown sensors"
-        self._param_def["used"] = True
-        self._param_state["used"] = True
-        self._param_off["used"] = True
-        self._param_on["used"] = True
+        for param in self._params.values():
+            param["used"] = True
 
-    def __del__(self):
-        """Detach callbacks when HA unloads the entity.
+        # PVAL / PMAX as ints, refreshed on every push (see update_callback)
+        self._state_value: int | None = None
+        self._on_value: int | None = None
+        self._refresh_values()
 
-        Wrapped in try/except so object cleanup during shutdown never raises.
-        """
-        try:
-            self._param_def.set_update_callback(None, self._table_key)
-            self._param_state.set_update_callback(None, self._table_key)
-            self._param_off.set_update_callback(None, self._table_key)
-            self._param_on.set_update_callback(None, self._table_key)
-        except Exception:
-            # We don't want teardown noise or crashes if HA is shutting down.
-            pass
+        # Pending state write; PDEF/PVAL/PMIN/PMAX pushed in one frame share it.
+        self._write_handle = None
 
     async def async_added_to_hass(self):
         """Subscribe to updates from the boiler parameters."""
+        # Pick up pushes that arrived between __init__ and now.
+        self._refresh_values()
         self.async_schedule_update_ha_state(False)
-        self._param_def.set_update_callback(self.update_callback, self._table_key)
-        self._param_state.set_update_callback(self.update_callback, self._table_key)
-        self._param_off.set_update_callback(self.update_callback, self._table_key)
-        self._param_on.set_update_callback(self.update_callback, self._table_key)
+        self.async_on_remove(
+            self.hass.bus.async_listen(
+                EVENT_CORE_CONFIG_UPDATE, self._async_core_config_updated
+            )
+        )
+        for param in self._params.values():
+            param.set_update_callback(self.update_callback, self._table_key)
+        self.async_on_remove(
+            self.web_boiler_system.add_connectivity_listener(
+                self._async_connectivity_changed
+            )
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Detach callbacks when HA unloads the entity."""
+        for param in self._params.values():
+            param.set_update_callback(None, self._table_key)
+        if self._write_handle is not None:
+            self._write_handle.cancel()
+            self._write_handle = None
+
+    @callback
+    def _async_core_config_updated(self, _event: Event) -> None:
+        """Pick up a changed HA time zone."""
+        self._tzinfo = dt_util.get_time_zone(self.hass.config.time_zone)
+        self._attrs_cache = None
 
     @property
     def should_poll(self) -> bool:
@@ -79,8 +117,27 @@ class WebBoilerCircuitSwitch(SwitchEntity):
 
     async def update_callback(self, _device):
         """Called by the device library when any tracked param changes."""
+        self._refresh_values()
+        self._attrs_cache = None
+        if self._write_handle is None:
+            self._write_handle = self.hass.loop.call_soon(self._flush_state)
+
+    async def _async_connectivity_changed(self, _connected: bool) -> None:
+        """Republish availability when the websocket connects or drops."""
+        if self._write_handle is None:
+            self._write_handle = self.hass.loop.call_soon(self._flush_state)
+
+    def _flush_state(self) -> None:
+        """Write the coalesced state."""
+        self._write_handle = None
         self.async_write_ha_state()
 
+    def _refresh_values(self) -> None:
+        """Re-read the params is_on compares."""
+        params = self._params
+        self._state_value = _coerce_int(params["state"].get("value"))
+        self._on_value = _coerce_int(params["on"].get("value"))
+
     @property
     def name(self) -> str:
         """Return the name shown in the UI."""
@@ -94,16 +151,14 @@ class WebBoilerCircuitSwitch(SwitchEntity):
     @property
     def is_on(self) -> bool:
         """Return True if this circuit is currently 'on'."""
-        try:
-            return int(self._param_state["value"]) == int(self._param_on["value"])
-        except (ValueError, KeyError, TypeError):
-            # If we can't parse, assume it's off instead of throwing.
-            return False
+        # If we can't parse, assume it's off instead of throwing.
+        return self._state_value is not None and self._state_value == self._on_value
 
     @property
     def available(self) -> bool:
         """Return True if the device is connected."""
-        return self.web_boiler_client.is_websocket_connected()
+        # Flag kept current by the system's connectivity callback.
+        return self.web_boiler_system.websocket_connected
 
     def error(self) -> str:
         """Return any last error message (not exposed to HA state)."""
@@ -111,34 +166,25 @@ class WebBoilerCircuitSwitch(SwitchEntity):
 
     def _compute_last_updated_str(self) -> str:
         """Return a human-presentable 'Last updated' timestamp string."""
-        tzinfo = dt_util.get_time_zone(self.hass.config.time_zone)
-        last_updated = "?"
+        raw_ts = self._params["state"].get("timestamp")
+        if raw_ts is None:
+            return "?"
         try:
-            if "timestamp" in self._param_state.keys():
-                raw_ts = self._param_state["timestamp"]
-                if raw_ts is not None:
-                    ts_int = int(raw_ts)
-                    last_dt = datetime.fromtimestamp(ts_int)
-                    last_updated = last_dt.astimezone(tzinfo).strftime(
-                        "%d.%m.%Y %H:%M:%S"
-                    )
+            return datetime.fromtimestamp(int(raw_ts), tz=self._tzinfo).strftime(
+                _TS_FMT
+            )
         except Exception:
-            # If anything goes sideways, we just leave last_updated as "?"
-            pass
-        return last_updated
+            # If anything goes sideways, we just show "?"
+            return "?"
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes shown in HA."""
-        return {
-            "Last updated": self._compute_last_updated_str(),
-        }
-
-    # Backwards-compat for older HA versions that still look for this name
-    @property
-    def device_state_attributes(self) -> dict[str, Any]:
-        """Alias to extra_state_attributes for legacy HA."""
-        return self.extra_state_attributes
+        if self._attrs_cache is None:
+            self._attrs_cache = {
+                "Last updated": self._compute_last_updated_str(),
+            }
+        return self._attrs_cache
 
     async def turn_circuit_on_off(self, value: bool):
         """Internal helper to call the API for this circuit."""
@@ -155,21 +201,15 @@ class WebBoilerCircuitSwitch(SwitchEntity):
             self._device["serial"], self._dbindex, False
         )
 
-    def turn_on(self, **kwargs) -> None:
-        """HA sync service call to turn on."""
-        asyncio.run_coroutine_threadsafe(
-            self.turn_circuit_on_off(True),
-            self.hass.loop,
-        )
+    async def async_turn_on(self, **kwargs) -> None:
+        """HA service call to turn on."""
+        await self.turn_circuit_on_off(True)
 
-    def turn_off(self, **kwargs) -> None:
-        """HA sync service call to turn off."""
-        asyncio.run_coroutine_threadsafe(
-            self.turn_circuit_on_off(False),
-            self.hass.loop,
-        )
+    async def async_turn_off(self, **kwargs) -> None:
+        """HA service call to turn off."""
+        await self.turn_circuit_on_off(False)
 
     @property
     def device_info(self) -> dict[str, Any]:
         """Return device registry info to group this switch under the boiler device."""
-        return create_device_info(self._device)
+        return self._device_info
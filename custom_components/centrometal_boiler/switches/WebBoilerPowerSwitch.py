@@ -3,11 +3,19 @@ from datetime import datetime
 from typing import Any
 
 import homeassistant.util.dt as dt_util
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_CORE_CONFIG_UPDATE
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.components.switch import SwitchEntity
 
-from ..common import create_device_info, format_name
-from ..const import DOMAIN, WEB_BOILER_CLIENT, WEB_BOILER_SYSTEM
+from ..common import create_device_info, format_name, get_entry_state
+
+
+# "Last updated" attribute format.
+_TS_FMT = "%d.%m.%Y %H:%M:%S"
+
+# String payloads with an explicit meaning (same spellings as the On/Off sensor).
+_ON_STRINGS = frozenset({"1", "ON", "On", "on", "TRUE", "True", "true"})
+_OFF_STRINGS = frozenset({"0", "OFF", "Off", "off", "FALSE", "False", "false"})
 
 
 def _value_is_on(v: Any) -> bool:
@@ -17,27 +25,26 @@ def _value_is_on(v: Any) -> bool:
     We treat obvious "on" cases as True, obvious "off" cases as False.
     This matches the mapping we use in WebBoilerBinaryOnOffSensor.
     """
-    # Explicit ON cases
-    if v in (1, "1", "ON", "On", "on", True, "TRUE", "True", "true"):
-        return True
-
-    # Explicit OFF cases
-    if v in (0, "0", "OFF", "Off", "off", False, "FALSE", "False", "false"):
-        return False
+    # bool is an int subclass: True/1 are on, False/0 are off.
+    if isinstance(v, (int, float)):
+        return v != 0
 
-    # Try int fallback
-    try:
-        intval = int(str(v))
-        if intval == 1:
+    if isinstance(v, str):
+        if v in _ON_STRINGS:
             return True
+        if v in _OFF_STRINGS:
+            return False
+        # Numeric strings like " 0", "00" or "01"
+        try:
+            intval = int(v)
+        except ValueError:
+            return v != "OFF"
         if intval == 0:
             return False
-    except (ValueError, TypeError):
-        pass
 
-    # If it's some other string like "CLEANING", that's basically "not actively commanded"
+    # If it's some other value like "CLEANING", that's basically "not actively commanded"
     # but for safety we'll treat anything non-"OFF" as on in fallback situations.
-    return str(v) != "OFF"
+    return True
 
 
 class WebBoilerPowerSwitch(SwitchEntity):
@@ -46,8 +53,9 @@ class WebBoilerPowerSwitch(SwitchEntity):
     def __init__(self, hass: HomeAssistant, device) -> None:
         """Initialize the Boiler Power Switch."""
         self.hass = hass
-        self.web_boiler_client = hass.data[DOMAIN][device.username][WEB_BOILER_CLIENT]
-        self.web_boiler_system = hass.data[DOMAIN][device.username][WEB_BOILER_SYSTEM]
+        state = get_entry_state(hass, device)
+        self.web_boiler_client = state.client
+        self.web_boiler_system = state.system
 
         self._device = device
         self._product = device["product"]
@@ -55,9 +63,20 @@ class WebBoilerPowerSwitch(SwitchEntity):
         # Friendly name like "Peltec II Boiler Switch" with prefix/serial as needed
         self._name = format_name(hass, device, f"{self._product} Boiler Switch")
         self._unique_id = device["serial"]
+        # Static for the entity's lifetime; build the registry dict once.
+        self._device_info = create_device_info(device)
 
         self._error_message = ""
 
+        # Background refresh started by the last on/off command.
+        self._refresh_task: asyncio.Task | None = None
+
+        # Resolved once; refreshed if the HA time zone is changed at runtime.
+        self._tzinfo = dt_util.get_time_zone(hass.config.time_zone)
+
+        # extra_state_attributes, rebuilt after the next param update.
+        self._attrs_cache: dict[str, Any] | None = None
+
         # We keep references to BOTH parameters:
         # - B_CMD  : "Command Active" (what the controller is told to do NOW)
         # - B_STATE: "Boiler State"   (what it's physically doing / cooling / etc.)
@@ -71,22 +90,14 @@ class WebBoilerPowerSwitch(SwitchEntity):
         # For convenience in attributes
         self._all_params = [p for p in (self._param_cmd, self._param_state) if p]
 
-    def __del__(self):
-        """Detach callbacks when HA unloads the entity."""
-        try:
-            if self._param_cmd:
-                self._param_cmd.set_update_callback(None, "switch")
-        except Exception:
-            pass
-        try:
-            if self._param_state:
-                self._param_state.set_update_callback(None, "switch")
-        except Exception:
-            pass
-
     async def async_added_to_hass(self):
         """Subscribe to events for live updates."""
         self.async_schedule_update_ha_state(False)
+        self.async_on_remove(
+            self.hass.bus.async_listen(
+                EVENT_CORE_CONFIG_UPDATE, self._async_core_config_updated
+            )
+        )
 
         # Subscribe to both so UI refreshes ASAP on command changes OR physical state changes.
         if self._param_cmd:
@@ -94,6 +105,30 @@ class WebBoilerPowerSwitch(SwitchEntity):
         if self._param_state:
             self._param_state.set_update_callback(self.update_callback, "switch")
 
+        self.async_on_remove(
+            self.web_boiler_system.add_connectivity_listener(
+                self._async_connectivity_changed
+            )
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Detach callbacks when HA unloads the entity."""
+        for param in self._all_params:
+            param.set_update_callback(None, "switch")
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+
+    async def _async_connectivity_changed(self, _connected: bool) -> None:
+        """Republish availability when the websocket connects or drops."""
+        self.async_write_ha_state()
+
+    @callback
+    def _async_core_config_updated(self, _event: Event) -> None:
+        """Pick up a changed HA time zone."""
+        self._tzinfo = dt_util.get_time_zone(self.hass.config.time_zone)
+        self._attrs_cache = None
+
     @property
     def should_poll(self) -> bool:
         """No polling needed; we get updates via websocket."""
@@ -101,6 +136,7 @@ class WebBoilerPowerSwitch(SwitchEntity):
 
     async def update_callback(self, _device):
         """Called by the library when either B_CMD or B_STATE changes."""
+        self._attrs_cache = None
         self.async_write_ha_state()
 
     @property
@@ -154,7 +190,8 @@ class WebBoilerPowerSwitch(SwitchEntity):
     @property
     def available(self) -> bool:
         """Expose entity as unavailable if websocket is down."""
-        return self.web_boiler_client.is_websocket_connected()
+        # Flag kept current by the system's connectivity callback.
+        return self.web_boiler_system.websocket_connected
 
     def _compute_last_updated_str(self) -> str:
         """
@@ -163,17 +200,15 @@ class WebBoilerPowerSwitch(SwitchEntity):
         We'll prefer B_CMD timestamp (because that's what we're displaying as state),
         and fallback to B_STATE if needed.
         """
-        tzinfo = dt_util.get_time_zone(self.hass.config.time_zone)
+        tzinfo = self._tzinfo
 
         # pick first param that actually has a usable timestamp
         for param in (self._param_cmd, self._param_state):
             if not param:
                 continue
             try:
-                raw_ts = param.get("timestamp") if hasattr(param, "get") else param["timestamp"]
-                ts_int = int(raw_ts)
-                dt_obj = datetime.fromtimestamp(ts_int)
-                return dt_obj.astimezone(tzinfo).strftime("%d.%m.%Y %H:%M:%S")
+                ts_int = int(param["timestamp"])
+                return datetime.fromtimestamp(ts_int, tz=tzinfo).strftime(_TS_FMT)
             except Exception:
                 continue
 
@@ -187,61 +222,54 @@ class WebBoilerPowerSwitch(SwitchEntity):
         - Raw command value (B_CMD)
         - Raw state value (B_STATE)
         """
-        attrs: dict[str, Any] = {
+        if self._attrs_cache is None:
+            self._attrs_cache = self._build_extra_state_attributes()
+        return self._attrs_cache
+
+    def _build_extra_state_attributes(self) -> dict[str, Any]:
+        """Build the attributes served (cached) by extra_state_attributes."""
+        param_cmd = self._param_cmd
+        param_state = self._param_state
+        return {
             "Last updated": self._compute_last_updated_str(),
+            "Command Active (B_CMD)": (
+                param_cmd.get("value", "N/A") if param_cmd else "N/A"
+            ),
+            "Boiler State (B_STATE)": (
+                param_state.get("value", "N/A") if param_state else "N/A"
+            ),
         }
 
-        try:
-            attrs["Command Active (B_CMD)"] = (
-                self._param_cmd["value"] if self._param_cmd else "N/A"
-            )
-        except Exception:
-            attrs["Command Active (B_CMD)"] = "N/A"
-
-        try:
-            attrs["Boiler State (B_STATE)"] = (
-                self._param_state["value"] if self._param_state else "N/A"
-            )
-        except Exception:
-            attrs["Boiler State (B_STATE)"] = "N/A"
-
-        return attrs
-
-    # Backwards compatibility for very old HA versions
-    @property
-    def device_state_attributes(self) -> dict[str, Any]:
-        """Alias to extra_state_attributes for legacy HA."""
-        return self.extra_state_attributes
-
     async def _async_turn_and_refresh(self, power_on: bool) -> None:
         """
         Send on/off command to boiler, then ask the client to refresh.
 
         We keep the same control API: web_boiler_client.turn(serial, True/False).
-        After calling turn(), we try a refresh() to pull updated values for B_CMD/B_STATE,
-        then push those new values through callbacks.
+        After calling turn(), we start a refresh() to pull updated values for
+        B_CMD/B_STATE. The refresh sleeps a few seconds per device, so it runs
+        in the background; a newer command replaces a refresh still running.
         """
         await self.web_boiler_client.turn(self._device["serial"], power_on)
 
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+        self._refresh_task = self.hass.async_create_task(self._async_refresh())
+
+    async def _async_refresh(self) -> None:
+        """Refresh all values, then push them through callbacks."""
         refreshed = await self.web_boiler_client.refresh()
         if refreshed:
             await self.web_boiler_client.data.notify_all_updated()
 
-    def turn_on(self, **kwargs) -> None:
-        """HA sync service call -> turn boiler ON."""
-        asyncio.run_coroutine_threadsafe(
-            self._async_turn_and_refresh(True),
-            self.hass.loop,
-        )
+    async def async_turn_on(self, **kwargs) -> None:
+        """HA service call -> turn boiler ON."""
+        await self._async_turn_and_refresh(True)
 
-    def turn_off(self, **kwargs) -> None:
-        """HA sync service call -> turn boiler OFF."""
-        asyncio.run_coroutine_threadsafe(
-            self._async_turn_and_refresh(False),
-            self.hass.loop,
-        )
+    async def async_turn_off(self, **kwargs) -> None:
+        """HA service call -> turn boiler OFF."""
+        await self._async_turn_and_refresh(False)
 
     @property
     def device_info(self) -> dict[str, Any]:
         """Return device registry info so HA groups this switch with the boiler."""
-        return create_device_info(self._device)
+        return self._device_info